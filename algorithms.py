@@ -1,13 +1,24 @@
 import random
 
+# -----------------------------------------------------------------------------
+# COMPARISON COUNTING
+# -----------------------------------------------------------------------------
+class SortStats:
+    """Counts element comparisons made by a running algorithm."""
+    def __init__(self):
+        self.comparisons = 0
+
 # -----------------------------------------------------------------------------
 # BUBBLE SORT IMPLEMENTATION
 # -----------------------------------------------------------------------------
-def bubble_sort(arr):
+def bubble_sort(arr, stats=None):
+    if stats is None:
+        stats = SortStats()
     n = len(arr)
     for i in range(n - 1):
         for j in range(0, n - i - 1):
             yield arr, [j, j + 1]
+            stats.comparisons += 1
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j+ 1], arr[j]
                 yield arr, [j, j+1] 
@@ -17,19 +28,21 @@ def bubble_sort(arr):
 # -----------------------------------------------------------------------------
 # MERGE SORT IMPLEMENTATION
 # -----------------------------------------------------------------------------
-def merge_sort(arr):
+def merge_sort(arr, stats=None):
     """Starts the recursive merge sort."""
-    yield from merge_sort_recursive(arr, 0, len(arr) - 1)
+    if stats is None:
+        stats = SortStats()
+    yield from merge_sort_recursive(arr, 0, len(arr) - 1, stats)
 
-def merge_sort_recursive(arr, start, end):
+def merge_sort_recursive(arr, start, end, stats):
     """Recursive helper function."""
     if start < end:
         mid = (start + end) // 2
-        yield from merge_sort_recursive(arr, start, mid)
-        yield from merge_sort_recursive(arr, mid + 1, end)
-        yield from merge(arr, start, mid, end)
+        yield from merge_sort_recursive(arr, start, mid, stats)
+        yield from merge_sort_recursive(arr, mid + 1, end, stats)
+        yield from merge(arr, start, mid, end, stats)
 
-def merge(arr, start, mid, end):
+def merge(arr, start, mid, end, stats):
     left_part = arr[start:mid + 1]
     right_part = arr[mid + 1:end + 1]
 
@@ -40,6 +53,7 @@ def merge(arr, start, mid, end):
     while i < len(left_part) and j < len(right_part):
         yield arr, [start + i, mid + 1 + j]
 
+        stats.comparisons += 1
         if left_part[i] <= right_part[j]:
             arr[k] = left_part[i]
             i += 1
@@ -65,24 +79,27 @@ def merge(arr, start, mid, end):
 # -----------------------------------------------------------------------------
 # QUICK SORT IMPLEMENTATION
 # -----------------------------------------------------------------------------
-def quick_sort(arr):
+def quick_sort(arr, stats=None):
     """Starts the recursive quick sort."""
-    yield from quick_sort_recursive(arr, 0, len(arr) - 1)
+    if stats is None:
+        stats = SortStats()
+    yield from quick_sort_recursive(arr, 0, len(arr) - 1, stats)
 
-def quick_sort_recursive(arr, low, high):
+def quick_sort_recursive(arr, low, high, stats):
     """Recursive helper function."""
     if low < high:
-        pivot_index = yield from partition(arr, low, high)
-        yield from quick_sort_recursive(arr, low, pivot_index - 1)
-        yield from quick_sort_recursive(arr, pivot_index + 1, high)
+        pivot_index = yield from partition(arr, low, high, stats)
+        yield from quick_sort_recursive(arr, low, pivot_index - 1, stats)
+        yield from quick_sort_recursive(arr, pivot_index + 1, high, stats)
 
-def partition(arr, low, high):
+def partition(arr, low, high, stats):
     """Partitions the array around a pivot."""
     pivot = arr[high]
     i = low - 1
 
     for j in range(low, high):
         yield arr, [j, high]
+        stats.comparisons += 1
         if arr[j] < pivot:
             i += 1
             arr[i], arr[j] = arr[j], arr[i]
@@ -95,12 +112,16 @@ def partition(arr, low, high):
 # -----------------------------------------------------------------------------
 # RADIX SORT IMPLEMENTATION
 # -----------------------------------------------------------------------------
-def radix_sort(arr):
+def radix_sort(arr, stats=None):
     """Main entry point for Radix Sort."""
+    if stats is None:
+        stats = SortStats()
     if not arr:
         return
 
+    # Finding the maximum is the only place radix sort compares elements.
     max_val = max(arr)
+    stats.comparisons += len(arr) - 1
     exp = 1
     while max_val // exp > 0:
         yield from counting_sort_on_digit(arr, exp)
@@ -132,18 +153,21 @@ def counting_sort_on_digit(arr, exp):
 # -----------------------------------------------------------------------------
 # LINEAR SEARCH IMPLEMENTATION
 # -----------------------------------------------------------------------------
-def linear_search_wrapper(arr):
+def linear_search_wrapper(arr, stats=None):
     """Wrapper to pick a random target and start the search."""
     if not arr:
         return
         
     target = random.choice(arr)
-    yield from linear_search(arr, target)
+    yield from linear_search(arr, target, stats)
 
-def linear_search(arr, target):
+def linear_search(arr, target, stats=None):
     """Iterates through the list until the target is found."""
+    if stats is None:
+        stats = SortStats()
     for i in range(len(arr)):
         yield arr, [i]
+        stats.comparisons += 1
         if arr[i] == target:
             yield arr, [i]
             return
\ No newline at end of file
@@ -2,6 +2,14 @@ import time
 import random
 import os
 import sys
+import json
+import math
+import argparse
+import hashlib
+import html
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 import pygal
 
 # Increase recursion limit for Quick Sort on sorted/reversed arrays (worst case)
@@ -11,14 +19,18 @@ sys.setrecursionlimit(25000)
 # Pure sorting algorithm implementations (no generators) for accurate timing
 # =============================================================================
 
-def bubble_sort(arr):
+def bubble_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return _sort_by_key(_bubble_sort_perm, arr, key, reverse)
     n = len(arr)
     for i in range(n - 1):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
 
-def merge_sort(arr):
+def merge_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return _sort_by_key(_merge_sort_perm, arr, key, reverse)
     if len(arr) > 1:
         mid = len(arr) // 2
         left = arr[:mid]
@@ -47,7 +59,9 @@ def merge_sort(arr):
             j += 1
             k += 1
 
-def quick_sort(arr):
+def quick_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return _sort_by_key(_quick_sort_perm, arr, key, reverse)
     _quick_sort_helper(arr, 0, len(arr) - 1)
 
 def _quick_sort_helper(arr, low, high):
@@ -66,9 +80,13 @@ def _partition(arr, low, high):
     arr[i + 1], arr[high] = arr[high], arr[i + 1]
     return i + 1
 
-def radix_sort(arr):
+def radix_sort(arr, key=None, reverse=False):
     if not arr:
         return
+    # Anything but non-negative ints (strings, negatives, bad key types) goes
+    # through the permutation path, which shifts, validates and sorts bytes.
+    if key is not None or reverse or not all(isinstance(x, int) for x in arr) or min(arr) < 0:
+        return _sort_by_key(_radix_sort_perm, arr, key, reverse)
     max_val = max(arr)
     exp = 1
     while max_val // exp > 0:
@@ -97,6 +115,220 @@ def _counting_sort(arr, exp):
     for i in range(n):
         arr[i] = output[i]
 
+# =============================================================================
+# Key-function and record (struct-of-arrays) sorting
+# =============================================================================
+#
+# Each algorithm has a *_perm variant that sorts a column of precomputed keys
+# in place and mirrors every move into a parallel index list `perm`. Keys are
+# therefore computed once (decorate-sort-undecorate) and comparisons stay on
+# bare key values instead of tuples or objects.
+
+MSD_INSERTION_CUTOFF = 32
+
+def _sort_permutation(perm_sort, keys, reverse=False):
+    """Sorts `keys` in place with `perm_sort` and returns the permutation applied.
+
+    Reverse order reverses before and after the sort, so stable algorithms
+    keep equal keys in their original order, like sorted(reverse=True).
+    """
+    perm = list(range(len(keys)))
+    if reverse:
+        keys.reverse()
+        perm.reverse()
+    perm_sort(keys, perm)
+    if reverse:
+        keys.reverse()
+        perm.reverse()
+    return perm
+
+def _sort_by_key(perm_sort, arr, key, reverse):
+    keys = [key(x) for x in arr] if key is not None else arr.copy()
+    perm = _sort_permutation(perm_sort, keys, reverse)
+    arr[:] = [arr[i] for i in perm]
+
+def _bubble_sort_perm(keys, perm):
+    n = len(keys)
+    for i in range(n - 1):
+        for j in range(0, n - i - 1):
+            if keys[j] > keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                perm[j], perm[j + 1] = perm[j + 1], perm[j]
+
+def _merge_sort_perm(keys, perm):
+    if len(keys) > 1:
+        mid = len(keys) // 2
+        left, left_perm = keys[:mid], perm[:mid]
+        right, right_perm = keys[mid:], perm[mid:]
+
+        _merge_sort_perm(left, left_perm)
+        _merge_sort_perm(right, right_perm)
+
+        i = j = k = 0
+        while i < len(left) and j < len(right):
+            if left[i] <= right[j]:
+                keys[k], perm[k] = left[i], left_perm[i]
+                i += 1
+            else:
+                keys[k], perm[k] = right[j], right_perm[j]
+                j += 1
+            k += 1
+
+        while i < len(left):
+            keys[k], perm[k] = left[i], left_perm[i]
+            i += 1
+            k += 1
+
+        while j < len(right):
+            keys[k], perm[k] = right[j], right_perm[j]
+            j += 1
+            k += 1
+
+def _quick_sort_perm(keys, perm):
+    _quick_sort_perm_helper(keys, perm, 0, len(keys) - 1)
+
+def _quick_sort_perm_helper(keys, perm, low, high):
+    if low < high:
+        pi = _partition_perm(keys, perm, low, high)
+        _quick_sort_perm_helper(keys, perm, low, pi - 1)
+        _quick_sort_perm_helper(keys, perm, pi + 1, high)
+
+def _partition_perm(keys, perm, low, high):
+    pivot = keys[high]
+    i = low - 1
+    for j in range(low, high):
+        if keys[j] < pivot:
+            i += 1
+            keys[i], keys[j] = keys[j], keys[i]
+            perm[i], perm[j] = perm[j], perm[i]
+    keys[i + 1], keys[high] = keys[high], keys[i + 1]
+    perm[i + 1], perm[high] = perm[high], perm[i + 1]
+    return i + 1
+
+def _radix_sort_perm(keys, perm):
+    if not keys:
+        return
+    if all(isinstance(k, str) for k in keys) or all(isinstance(k, bytes) for k in keys):
+        _msd_radix_sort_perm(keys, perm)
+        return
+    if not all(isinstance(k, int) for k in keys):
+        bad = next((k for k in keys if not isinstance(k, (int, str, bytes))), None)
+        if bad is None:
+            raise ValueError("Radix Sort keys must be all int, all str or all bytes")
+        raise ValueError(f"Radix Sort needs int, str or bytes keys, got {type(bad).__name__}")
+
+    # The base-10 digit passes assume non-negative keys, so shift by the minimum.
+    min_val = min(keys)
+    if min_val < 0:
+        keys[:] = [k - min_val for k in keys]
+    max_val = max(keys)
+    exp = 1
+    while max_val // exp > 0:
+        _counting_sort_perm(keys, perm, exp)
+        exp *= 10
+    if min_val < 0:
+        keys[:] = [k + min_val for k in keys]
+
+def _counting_sort_perm(keys, perm, exp):
+    n = len(keys)
+    output = [0] * n
+    output_perm = [0] * n
+    count = [0] * 10
+
+    for i in range(n):
+        index = (keys[i] // exp) % 10
+        count[index] += 1
+
+    for i in range(1, 10):
+        count[i] += count[i - 1]
+
+    i = n - 1
+    while i >= 0:
+        index = (keys[i] // exp) % 10
+        output[count[index] - 1] = keys[i]
+        output_perm[count[index] - 1] = perm[i]
+        count[index] -= 1
+        i -= 1
+
+    keys[:] = output
+    perm[:] = output_perm
+
+def _msd_radix_sort_perm(keys, perm):
+    """MSD radix sort of all-str or all-bytes keys on their (UTF-8) bytes.
+
+    UTF-8 byte order matches code point order, so the result agrees with
+    Python's own string ordering.
+    """
+    byte_keys = [k.encode("utf-8") for k in keys] if isinstance(keys[0], str) else keys
+    order = list(range(len(keys)))
+    _msd_bucket_sort(byte_keys, order, 0, len(order), 0)
+    keys[:] = [keys[i] for i in order]
+    perm[:] = [perm[i] for i in order]
+
+def _msd_bucket_sort(byte_keys, order, lo, hi, depth):
+    if hi - lo <= MSD_INSERTION_CUTOFF:
+        # Keys in this range share their first `depth` bytes, so a full compare is equivalent.
+        for i in range(lo + 1, hi):
+            idx = order[i]
+            current = byte_keys[idx]
+            j = i - 1
+            while j >= lo and byte_keys[order[j]] > current:
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = idx
+        return
+
+    # Bucket 0 holds keys that end at this depth; bytes 0-255 map to buckets 1-256.
+    buckets = [[] for _ in range(257)]
+    for idx in order[lo:hi]:
+        k = byte_keys[idx]
+        buckets[k[depth] + 1 if depth < len(k) else 0].append(idx)
+
+    pos = lo
+    for b, bucket in enumerate(buckets):
+        if not bucket:
+            continue
+        order[pos:pos + len(bucket)] = bucket
+        if b > 0 and len(bucket) > 1:
+            _msd_bucket_sort(byte_keys, order, pos, pos + len(bucket), depth + 1)
+        pos += len(bucket)
+
+PERM_SORTS = {
+    "Bubble Sort": _bubble_sort_perm,
+    "Merge Sort": _merge_sort_perm,
+    "Quick Sort": _quick_sort_perm,
+    "Radix Sort": _radix_sort_perm,
+}
+STABLE_SORTS = {"Bubble Sort", "Merge Sort", "Radix Sort"}
+
+def sort_records(columns, by, algo_name="Merge Sort", reverse=False):
+    """Sorts a struct-of-arrays record set in place.
+
+    `columns` maps field name -> list of values, all the same length. `by`
+    is one field name or a list of them, most significant first. The key
+    column is sorted on its own and the resulting permutation is applied
+    to each column with one gather pass. Multi-field sorts run one stable pass
+    per field, least significant first, and need a stable algorithm.
+    """
+    fields = [by] if isinstance(by, str) else list(by)
+    lengths = {name: len(column) for name, column in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"All record columns must have the same length, got {lengths}")
+    if len(fields) > 1 and algo_name not in STABLE_SORTS:
+        raise ValueError(f"{algo_name} is not stable and cannot sort by several fields")
+    perm_sort = PERM_SORTS[algo_name]
+
+    perm = list(range(len(columns[fields[0]])))
+    for field in reversed(fields):
+        column = columns[field]
+        keys = [column[i] for i in perm]
+        step = _sort_permutation(perm_sort, keys, reverse)
+        perm = [perm[i] for i in step]
+
+    for column in columns.values():
+        column[:] = [column[i] for i in perm]
+    return perm
+
 def linear_search(arr, target):
     for i in range(len(arr)):
         if arr[i] == target:
@@ -119,52 +351,88 @@ def generate_array(size, condition):
 # Benchmarking function
 # =============================================================================
 
-def benchmark(algo_func, arr, runs=5):
-    """Times the algorithm over multiple runs and returns the average time in seconds."""
+def benchmark_samples(algo_func, arr, runs=5):
+    """Times the algorithm over multiple runs and returns every run time in seconds."""
     times = []
     for _ in range(runs):
         arr_copy = arr.copy()
-        start = time.time()
+        start = time.perf_counter()
         algo_func(arr_copy)
-        end = time.time()
+        end = time.perf_counter()
         times.append(end - start)
+    return times
+
+def benchmark(algo_func, arr, runs=5):
+    """Times the algorithm over multiple runs and returns the average time in seconds."""
+    times = benchmark_samples(algo_func, arr, runs)
     return sum(times) / len(times)
 
-def benchmark_linear_search(arr, runs=5):
-    """Special benchmark for linear search - searches for a random existing element."""
+def benchmark_linear_search_samples(arr, runs=5, rng=random):
+    """Raw run times for linear search on a random existing element.
+
+    Targets come from `rng`, so a dedicated generator keeps the draws from
+    consuming the stream that generates input arrays.
+    """
     times = []
     for _ in range(runs):
-        target = random.choice(arr)
-        start = time.time()
+        target = rng.choice(arr)
+        start = time.perf_counter()
         linear_search(arr, target)
-        end = time.time()
+        end = time.perf_counter()
         times.append(end - start)
+    return times
+
+def benchmark_linear_search(arr, runs=5):
+    """Special benchmark for linear search - searches for a random existing element."""
+    times = benchmark_linear_search_samples(arr, runs)
     return sum(times) / len(times)
 
 # =============================================================================
 # Main analysis
 # =============================================================================
 
-def run_analysis():
-    sizes = [100, 500, 1000, 2000, 5000, 10000]
-    conditions = ["Random", "Sorted", "Reversed"]
-    algorithms = {
-        "Bubble Sort": bubble_sort,
-        "Merge Sort": merge_sort,
-        "Quick Sort": quick_sort,
-        "Radix Sort": radix_sort,
-    }
+BENCHMARK_SIZES = [100, 500, 1000, 2000, 5000, 10000]
+BENCHMARK_CONDITIONS = ["Random", "Sorted", "Reversed"]
+BENCHMARK_ALGORITHMS = {
+    "Bubble Sort": bubble_sort,
+    "Merge Sort": merge_sort,
+    "Quick Sort": quick_sort,
+    "Radix Sort": radix_sort,
+}
+# Every sort plus linear search, per condition and size.
+BENCHMARK_CELLS = len(BENCHMARK_CONDITIONS) * (len(BENCHMARK_ALGORITHMS) + 1) * len(BENCHMARK_SIZES)
+
+def run_analysis(runs=5, seed=None, workers=1, embed=False):
+    """Benchmarks every algorithm and returns (results, samples, sizes, conditions, specs).
+
+    results[condition][algo_name] holds the average time per size,
+    samples[condition][algo_name] the raw run times per size and specs
+    the rendered chart specs.
+    """
+    if seed is not None:
+        random.seed(seed)
+    # Separate stream for search targets: the number of draws depends on `runs`,
+    # and must not shift the arrays generated from the global stream.
+    target_rng = random.Random(seed)
+
+    sizes = BENCHMARK_SIZES
+    conditions = BENCHMARK_CONDITIONS
+    algorithms = BENCHMARK_ALGORITHMS
 
     # results[condition][algo_name] = list of avg times for each size
+    # samples[condition][algo_name] = list of raw run-time lists for each size
     results = {}
+    samples = {}
     for cond in conditions:
         results[cond] = {}
+        samples[cond] = {}
         for algo_name in list(algorithms.keys()) + ["Linear Search"]:
             results[cond][algo_name] = []
+            samples[cond][algo_name] = []
 
     print("=" * 65)
     print("  SORTING ALGORITHM PERFORMANCE ANALYSIS")
-    print("  Averaging over 5 runs per configuration")
+    print(f"  Averaging over {runs} runs per configuration")
     print("=" * 65)
 
     for cond in conditions:
@@ -179,7 +447,9 @@ def run_analysis():
             print(f"{algo_name:<16} ", end="", flush=True)
             for size in sizes:
                 arr = generate_array(size, cond)
-                avg_time = benchmark(algo_func, arr)
+                times = benchmark_samples(algo_func, arr, runs)
+                avg_time = sum(times) / len(times)
+                samples[cond][algo_name].append(times)
                 results[cond][algo_name].append(avg_time)
                 print(f"{avg_time:>9.5f}s", end="", flush=True)
             print()
@@ -188,87 +458,568 @@ def run_analysis():
         print(f"{'Linear Search':<16} ", end="", flush=True)
         for size in sizes:
             arr = generate_array(size, "Random")
-            avg_time = benchmark_linear_search(arr)
+            times = benchmark_linear_search_samples(arr, runs, target_rng)
+            avg_time = sum(times) / len(times)
+            samples[cond]["Linear Search"].append(times)
             results[cond]["Linear Search"].append(avg_time)
             print(f"{avg_time:>9.5f}s", end="", flush=True)
         print()
 
     # Save charts
-    os.makedirs("charts", exist_ok=True)
-    generate_charts(results, sizes, conditions)
+    specs = generate_charts(results, sizes, conditions, workers, embed)
     print("\nDone! Charts saved to charts/ folder.")
+    return results, samples, sizes, conditions, specs
+
+def generate_records(size, width, key_type="int"):
+    """Struct-of-arrays records: a `key` column plus width - 1 payload columns."""
+    if key_type == "str":
+        keys = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=8)) for _ in range(size)]
+    else:
+        keys = generate_array(size, "Random")
+    columns = {"key": keys}
+    for c in range(1, width):
+        columns[f"field_{c}"] = [random.random() for _ in range(size)]
+    return columns
+
+def benchmark_records_samples(algo_name, columns, runs=5):
+    """Raw run times for sort_records on fresh copies of `columns`, keyed on `key`."""
+    times = []
+    for _ in range(runs):
+        columns_copy = {name: col.copy() for name, col in columns.items()}
+        start = time.perf_counter()
+        sort_records(columns_copy, "key", algo_name)
+        end = time.perf_counter()
+        times.append(end - start)
+    return times
+
+def run_record_analysis(runs=5, seed=None, size=2000, widths=(1, 2, 4, 8, 16), workers=1, embed=False):
+    """Benchmarks struct-of-arrays record sorting across record widths.
+
+    The "(tuples)" rows sort the same records as a list of row tuples with
+    key=itemgetter(0), for comparison with the column layout.
+    Returns (results, specs) where specs holds the rendered chart spec.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    # (row label, algorithm, key type, layout)
+    cases = [(algo_name, algo_name, "int", "columns") for algo_name in PERM_SORTS]
+    cases += [("Merge (str key)", "Merge Sort", "str", "columns"), ("Radix (str key)", "Radix Sort", "str", "columns")]
+    cases += [(f"{algo_name.split()[0]} (tuples)", algo_name, "int", "rows")
+              for algo_name in ("Merge Sort", "Quick Sort", "Radix Sort")]
+    results = {label: [] for label, _, _, _ in cases}
+
+    print("=" * 65)
+    print("  RECORD SORTING ANALYSIS (struct-of-arrays)")
+    print(f"  n={size}, averaging over {runs} runs per configuration")
+    print("=" * 65)
+    print(f"{'Algorithm':<16} ", end="")
+    for w in widths:
+        print(f"{'w='+str(w):>10}", end="")
+    print()
+    print("-" * (16 + 10 * len(widths)))
+
+    for label, algo_name, key_type, layout in cases:
+        print(f"{label:<16} ", end="", flush=True)
+        for width in widths:
+            columns = generate_records(size, width, key_type)
+            if layout == "rows":
+                rows = list(zip(*columns.values()))
+                sort_rows = partial(BENCHMARK_ALGORITHMS[algo_name], key=itemgetter(0))
+                times = benchmark_samples(sort_rows, rows, runs)
+            else:
+                times = benchmark_records_samples(algo_name, columns, runs)
+            avg_time = sum(times) / len(times)
+            results[label].append(avg_time)
+            print(f"{avg_time:>9.5f}s", end="", flush=True)
+        print()
+
+    spec = chart_spec(
+        "Line",
+        f"{CHART_DIR}/record_widths.svg",
+        [(label, [round(t, 6) for t in times]) for label, times in results.items()],
+        title=f"Record Sorting vs Record Width (n={size}, Random Keys)",
+        x_title="Record Width (columns)",
+        y_title="Average Time (seconds)",
+        x_labels=[str(w) for w in widths],
+        legend_at_bottom=True,
+        dots_size=4,
+        width=900,
+        height=500
+    )
+    render_chart_specs([spec], workers, embed)
+    return results, [spec]
 
 # =============================================================================
 # Chart generation using pygal (SVG output)
 # =============================================================================
+#
+# Charts are described as plain-data specs (JSON-serialisable dicts) so they
+# can be hashed and shipped to worker processes. A spec is only re-rendered
+# when its hash differs from the one recorded in the manifest for that file.
+
+CHART_DIR = "charts"
+CHART_MANIFEST = os.path.join(CHART_DIR, ".chart_hashes.json")
+DASHBOARD_FILE = os.path.join(CHART_DIR, "dashboard.html")
+# Script-free copies of each chart for the dashboard, cached by spec hash like the SVGs.
+EMBED_DIR = os.path.join(CHART_DIR, ".embed")
+
+def chart_spec(kind, filename, series, **config):
+    """Builds a chart spec: pygal chart class name, output file, series and options."""
+    config.setdefault("style", "CleanStyle")
+    return {
+        "kind": kind,
+        "filename": filename,
+        "config": config,
+        "series": [[name, values] for name, values in series],
+    }
+
+def spec_hash(spec):
+    payload = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-def generate_charts(results, sizes, conditions):
-    style = pygal.style.CleanStyle
+def _build_chart(spec, **overrides):
+    config = dict(spec["config"], **overrides)
+    config["style"] = getattr(pygal.style, config["style"])
+    chart = getattr(pygal, spec["kind"])(**config)
+    for name, values in spec["series"]:
+        chart.add(name, values)
+    return chart
+
+def embed_path(spec):
+    return os.path.join(EMBED_DIR, os.path.basename(spec["filename"]))
+
+def render_chart_spec(spec, write_svg=True, write_embed=False):
+    """Renders one spec to its SVG file and/or its dashboard copy without pygal's
+    external tooltip script. Top-level so worker processes can pickle it."""
+    if write_svg:
+        _build_chart(spec).render_to_file(spec["filename"])
+    if write_embed:
+        _build_chart(spec, js=[]).render_to_file(embed_path(spec))
+    return spec["filename"]
+
+def _load_manifest():
+    if not os.path.exists(CHART_MANIFEST):
+        return {}
+    try:
+        with open(CHART_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest):
+    with open(CHART_MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def _is_current(manifest, path, digest):
+    return manifest.get(path) == digest and os.path.exists(path)
+
+def render_chart_specs(specs, workers=1, embed=False):
+    """Renders every spec whose hash changed.
+
+    With `embed` the script-free dashboard copy is rendered in the same job
+    and cached the same way. Pooling is opt-in: a process pool is only used
+    when `workers` > 1, since for this tree's handful of charts process
+    start-up costs more than it saves.
+    """
+    os.makedirs(CHART_DIR, exist_ok=True)
+    if embed:
+        os.makedirs(EMBED_DIR, exist_ok=True)
+    manifest = _load_manifest()
+
+    jobs = []
+    for spec in specs:
+        digest = spec_hash(spec)
+        write_svg = not _is_current(manifest, spec["filename"], digest)
+        write_embed = embed and not _is_current(manifest, embed_path(spec), digest)
+        if not write_svg:
+            print(f"  Unchanged: {spec['filename']}")
+        if write_svg or write_embed:
+            jobs.append((spec, digest, write_svg, write_embed))
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(render_chart_spec, *zip(*[(spec, svg, emb) for spec, _, svg, emb in jobs])))
+    else:
+        for spec, _, write_svg, write_embed in jobs:
+            render_chart_spec(spec, write_svg, write_embed)
+
+    rendered = []
+    for spec, digest, write_svg, write_embed in jobs:
+        if write_svg:
+            manifest[spec["filename"]] = digest
+            rendered.append(spec["filename"])
+            print(f"  Saved: {spec['filename']}")
+        if write_embed:
+            manifest[embed_path(spec)] = digest
+
+    _save_manifest(manifest)
+    return rendered
+
+def build_chart_specs(results, sizes, conditions):
+    specs = []
+    size_labels = [str(s) for s in sizes]
 
     # Chart 1-3: Line chart for each input condition
     for cond in conditions:
-        chart = pygal.Line(
+        specs.append(chart_spec(
+            "Line",
+            f"{CHART_DIR}/performance_{cond.lower()}.svg",
+            [(algo_name, [round(t, 6) for t in times]) for algo_name, times in results[cond].items()],
             title=f"Sorting Algorithm Performance - {cond} Input",
             x_title="Array Size (n)",
             y_title="Average Time (seconds)",
-            x_labels=[str(s) for s in sizes],
-            style=style,
+            x_labels=size_labels,
             legend_at_bottom=True,
             dots_size=4,
             width=900,
             height=500
-        )
-
-        for algo_name, times in results[cond].items():
-            chart.add(algo_name, [round(t, 6) for t in times])
-
-        filename = f"charts/performance_{cond.lower()}.svg"
-        chart.render_to_file(filename)
-        print(f"  Saved: {filename}")
+        ))
 
     # Chart 4: Bar chart comparing algorithms across conditions at n=5000
     target_size = 5000
     size_index = sizes.index(target_size)
     algo_names = list(results["Random"].keys())
 
-    chart = pygal.Bar(
+    specs.append(chart_spec(
+        "Bar",
+        f"{CHART_DIR}/comparison_bar_chart.svg",
+        [(cond, [round(results[cond][algo][size_index], 6) for algo in algo_names]) for cond in conditions],
         title=f"Algorithm Comparison Across Input Conditions (n={target_size})",
         x_title="Algorithm",
         y_title="Average Time (seconds)",
         x_labels=algo_names,
-        style=style,
         legend_at_bottom=True,
         width=900,
         height=500
-    )
-
-    for cond in conditions:
-        times = [round(results[cond][algo][size_index], 6) for algo in algo_names]
-        chart.add(cond, times)
-
-    chart.render_to_file("charts/comparison_bar_chart.svg")
-    print("  Saved: charts/comparison_bar_chart.svg")
+    ))
 
     # Chart 5: Bar chart showing scaling of each algorithm (Random input only)
     for algo_name in algo_names:
-        chart = pygal.Bar(
+        safe_name = algo_name.lower().replace(" ", "_")
+        specs.append(chart_spec(
+            "Bar",
+            f"{CHART_DIR}/scaling_{safe_name}.svg",
+            [(algo_name, [round(t, 6) for t in results["Random"][algo_name]])],
             title=f"{algo_name} - Scaling Across Array Sizes (Random Input)",
             x_title="Array Size",
             y_title="Average Time (seconds)",
-            x_labels=[str(s) for s in sizes],
-            style=style,
+            x_labels=size_labels,
             show_legend=False,
             width=700,
             height=400
+        ))
+
+    return specs
+
+def generate_dashboard(specs, output=DASHBOARD_FILE):
+    """Writes a single self-contained HTML page with every chart's SVG inlined.
+
+    Uses the script-free copies that render_chart_specs(..., embed=True)
+    cached under EMBED_DIR, so no chart is rendered here.
+    """
+    sections = []
+    for spec in specs:
+        with open(embed_path(spec), encoding="utf-8") as f:
+            svg = f.read()
+        # Drop the XML declaration so the SVG can be embedded directly in HTML.
+        if svg.startswith("<?xml"):
+            svg = svg[svg.index("?>") + 2:]
+        title = html.escape(spec["config"].get("title", os.path.basename(spec["filename"])))
+        sections.append(f'<section>\n<h2>{title}</h2>\n{svg.strip()}\n</section>')
+
+    page = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>Sorting Algorithm Performance Dashboard</title>\n"
+        "<style>body{font-family:sans-serif;margin:2em;background:#fafafa}"
+        "section{margin-bottom:2em}h2{font-size:1em;color:#555}"
+        "svg{max-width:100%;height:auto;background:#fff}</style>\n"
+        "</head>\n<body>\n<h1>Sorting Algorithm Performance Dashboard</h1>\n"
+        + "\n".join(sections)
+        + "\n</body>\n</html>\n"
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(page)
+    print(f"  Saved: {output}")
+    return output
+
+def generate_charts(results, sizes, conditions, workers=1, embed=False):
+    """Renders the standard charts and returns their specs."""
+    specs = build_chart_specs(results, sizes, conditions)
+    render_chart_specs(specs, workers, embed)
+    return specs
+
+# =============================================================================
+# Baseline snapshots and regression comparison
+# =============================================================================
+
+BASELINE_DIR = "baselines"
+DEFAULT_BASELINE_SEED = 0
+# Enough runs that a Holm-corrected gate over all BENCHMARK_CELLS can still fire.
+DEFAULT_BASELINE_RUNS = 10
+DEFAULT_RUNS = 5
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+def save_baseline(name, samples, sizes, conditions, runs, seed):
+    """Writes the raw timing samples of this run to baselines/<name>.json."""
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    snapshot = {
+        "name": name,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "runs": runs,
+        "seed": seed,
+        "sizes": sizes,
+        "conditions": conditions,
+        "samples": samples,
+    }
+    path = baseline_path(name)
+    with open(path, "w") as f:
+        json.dump(snapshot, f, indent=2)
+    return path
+
+def load_baseline(name):
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No baseline named '{name}' (expected {path})")
+    with open(path) as f:
+        return json.load(f)
+
+@lru_cache(maxsize=None)
+def _mann_whitney_count(n1, n2, u):
+    """Number of orderings of n1 + n2 untied values whose U statistic is <= u."""
+    if u < 0:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1
+    # The largest value either comes from sample 1 (beating all n2) or sample 2.
+    return _mann_whitney_count(n1 - 1, n2, u - n2) + _mann_whitney_count(n1, n2 - 1, u)
+
+def mann_whitney_greater(current, baseline):
+    """One-sided Mann-Whitney U test that `current` times are larger than `baseline`.
+
+    Returns (U, p_value). Uses the exact distribution when there are no ties
+    and a tie-corrected normal approximation otherwise.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    u = 0.0
+    for c in current:
+        for b in baseline:
+            if c > b:
+                u += 1
+            elif c == b:
+                u += 0.5
+
+    combined = sorted(current + baseline)
+    tie_sizes = []
+    run_len = 1
+    for prev, val in zip(combined, combined[1:]):
+        if val == prev:
+            run_len += 1
+        else:
+            if run_len > 1:
+                tie_sizes.append(run_len)
+            run_len = 1
+    if run_len > 1:
+        tie_sizes.append(run_len)
+
+    if not tie_sizes:
+        # P(U >= u) equals P(U <= n1*n2 - u) by symmetry of the null distribution.
+        p_value = _mann_whitney_count(n1, n2, int(n1 * n2 - u)) / math.comb(n1 + n2, n1)
+        return u, min(1.0, p_value)
+
+    n = n1 + n2
+    tie_term = sum(t ** 3 - t for t in tie_sizes) / (n * (n - 1))
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / sigma
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+def min_p_value(n1, n2):
+    """Smallest p-value the exact one-sided Mann-Whitney test can give for these sample sizes."""
+    return 1 / math.comb(n1 + n2, n1)
+
+def holm_adjust(p_values):
+    """Holm-Bonferroni adjusted p-values, in the same order as `p_values`."""
+    m = len(p_values)
+    adjusted = [1.0] * m
+    running_max = 0.0
+    for rank, index in enumerate(sorted(range(m), key=lambda i: p_values[i])):
+        running_max = max(running_max, min(1.0, (m - rank) * p_values[index]))
+        adjusted[index] = running_max
+    return adjusted
+
+def _median(values):
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+def compare_to_baseline(baseline, samples, sizes, conditions, threshold=0.10, alpha=0.05):
+    """Compares each (condition, algorithm, size) cell against the baseline.
+
+    A cell regresses when its median time grew by more than `threshold`
+    and the Mann-Whitney test says the slowdown is significant at `alpha`
+    after a Holm correction across all compared cells. Cells missing from
+    either side are skipped.
+    """
+    rows = []
+    base_samples = baseline["samples"]
+    base_sizes = baseline["sizes"]
+    for cond in conditions:
+        if cond not in base_samples:
+            continue
+        for algo_name, per_size in samples[cond].items():
+            if algo_name not in base_samples[cond]:
+                continue
+            for size_index, size in enumerate(sizes):
+                if size not in base_sizes:
+                    continue
+                base = base_samples[cond][algo_name][base_sizes.index(size)]
+                current = per_size[size_index]
+                base_median = _median(base)
+                current_median = _median(current)
+                ratio = current_median / base_median if base_median > 0 else 1.0
+                _, p_value = mann_whitney_greater(current, base)
+                rows.append({
+                    "condition": cond,
+                    "algorithm": algo_name,
+                    "size": size,
+                    "baseline": base_median,
+                    "current": current_median,
+                    "ratio": ratio,
+                    "p_value": p_value,
+                })
+
+    for row, p_adjusted in zip(rows, holm_adjust([row["p_value"] for row in rows])):
+        row["p_adjusted"] = p_adjusted
+        row["regressed"] = row["ratio"] > 1 + threshold and p_adjusted < alpha
+    return rows
+
+def print_regression_report(rows, baseline_name, threshold, alpha):
+    print("\n" + "=" * 65)
+    print(f"  REGRESSION REPORT vs baseline '{baseline_name}'")
+    print(f"  Threshold: +{threshold:.0%} median time, Mann-Whitney alpha={alpha} (Holm-corrected)")
+    print("=" * 65)
+    print(f"{'Condition':<10} {'Algorithm':<16} {'n':>6} {'Base':>10} {'Now':>10} {'Ratio':>7} {'p':>7} {'p(adj)':>7}")
+    print("-" * 80)
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(f"{row['condition']:<10} {row['algorithm']:<16} {row['size']:>6} "
+              f"{row['baseline']:>9.5f}s {row['current']:>9.5f}s "
+              f"{row['ratio']:>6.2f}x {row['p_value']:>7.4f} {row['p_adjusted']:>7.4f}{flag}")
+
+    regressed = [row for row in rows if row["regressed"]]
+    print(f"\n{len(regressed)} of {len(rows)} cells regressed.")
+    return regressed
+
+def generate_ratio_chart(rows, sizes, baseline_name, filename=f"{CHART_DIR}/baseline_ratio.svg", workers=1, embed=False):
+    """Line chart of current/baseline median time ratio per algorithm and condition."""
+    series = {}
+    for row in rows:
+        label = f"{row['algorithm']} ({row['condition']})"
+        series.setdefault(label, {})[row["size"]] = round(row["ratio"], 3)
+
+    spec = chart_spec(
+        "Line",
+        filename,
+        [(label, [by_size.get(s) for s in sizes]) for label, by_size in series.items()],
+        title=f"Time Ratio vs Baseline '{baseline_name}' (1.0 = unchanged)",
+        x_title="Array Size (n)",
+        y_title="Current / Baseline Median Time",
+        x_labels=[str(s) for s in sizes],
+        legend_at_bottom=True,
+        dots_size=4,
+        width=900,
+        height=500
+    )
+    render_chart_specs([spec], workers, embed)
+    return [spec]
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms and render pygal charts.")
+    parser.add_argument("--runs", type=int, default=None,
+                        help=f"timed runs per configuration (default: {DEFAULT_RUNS}, "
+                             f"{DEFAULT_BASELINE_RUNS} with --save-baseline, the baseline's runs with --compare)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for generated input arrays")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes used to render charts; pooling is opt-in and only "
+                             "used when N > 1 (default: 1, render in-process)")
+    parser.add_argument("--dashboard", action="store_true",
+                        help="also write charts/dashboard.html embedding every chart from this run")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--records", action="store_true",
+                      help="benchmark struct-of-arrays record sorting across record widths instead")
+    mode.add_argument("--save-baseline", metavar="NAME", help="save raw timings as baselines/NAME.json")
+    mode.add_argument("--compare", metavar="NAME", help="compare this run against baselines/NAME.json")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed median slowdown before a cell regresses (default: 0.10 = 10%%)")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="significance level for the Mann-Whitney test (default: 0.05)")
+    return parser
+
+def _check_gate_power(parser, runs, baseline_runs, cells, alpha):
+    """Rejects run counts for which no cell could ever pass the Holm-corrected test."""
+    smallest = min_p_value(runs, baseline_runs)
+    if smallest >= alpha / cells:
+        parser.error(
+            f"with {runs} runs against {baseline_runs} baseline runs the smallest possible "
+            f"Mann-Whitney p-value is {smallest:.2g}, which can never beat alpha={alpha} "
+            f"Holm-corrected over {cells} cells; use more --runs"
         )
-        times = [round(t, 6) for t in results["Random"][algo_name]]
-        chart.add(algo_name, times)
 
-        safe_name = algo_name.lower().replace(" ", "_")
-        filename = f"charts/scaling_{safe_name}.svg"
-        chart.render_to_file(filename)
-        print(f"  Saved: {filename}")
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.records:
+        _, specs = run_record_analysis(args.runs if args.runs is not None else DEFAULT_RUNS, args.seed,
+                                       workers=args.workers, embed=args.dashboard)
+        if args.dashboard:
+            generate_dashboard(specs)
+        return 0
+
+    if args.save_baseline:
+        runs = args.runs if args.runs is not None else DEFAULT_BASELINE_RUNS
+        _check_gate_power(parser, runs, runs, BENCHMARK_CELLS, args.alpha)
+        seed = args.seed if args.seed is not None else DEFAULT_BASELINE_SEED
+        _, samples, sizes, conditions, specs = run_analysis(runs, seed, args.workers, args.dashboard)
+        if args.dashboard:
+            generate_dashboard(specs)
+        path = save_baseline(args.save_baseline, samples, sizes, conditions, runs, seed)
+        print(f"Baseline saved: {path}")
+        return 0
+
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except FileNotFoundError as e:
+            # parser.error exits with status 2, keeping status 1 for regressions.
+            parser.error(str(e))
+        runs = args.runs if args.runs is not None else baseline["runs"]
+        _check_gate_power(parser, runs, baseline["runs"], BENCHMARK_CELLS, args.alpha)
+        # Reuse the baseline's seed so Random inputs match cell for cell. Search
+        # targets use their own generator, so this holds for any --runs.
+        seed = args.seed if args.seed is not None else baseline.get("seed")
+        _, samples, sizes, conditions, specs = run_analysis(runs, seed, args.workers, args.dashboard)
+        rows = compare_to_baseline(baseline, samples, sizes, conditions, args.threshold, args.alpha)
+        regressed = print_regression_report(rows, args.compare, args.threshold, args.alpha)
+        specs += generate_ratio_chart(rows, sizes, args.compare, workers=args.workers, embed=args.dashboard)
+        if args.dashboard:
+            generate_dashboard(specs)
+        return 1 if regressed else 0
+
+    *_, specs = run_analysis(args.runs if args.runs is not None else DEFAULT_RUNS, args.seed, args.workers, args.dashboard)
+    if args.dashboard:
+        generate_dashboard(specs)
+    return 0
 
 
 if __name__ == "__main__":
-    run_analysis()
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import random
+import sys
+from operator import itemgetter
+
+import performance_analysis as pa
+
+# =============================================================================
+# Self-checks for key-function, radix and record sorting against sorted()
+# Run with: python self_check.py
+# =============================================================================
+
+SORTS = {
+    "Bubble Sort": pa.bubble_sort,
+    "Merge Sort": pa.merge_sort,
+    "Quick Sort": pa.quick_sort,
+    "Radix Sort": pa.radix_sort,
+}
+
+def random_string(rng):
+    # Mixes ASCII with multi-byte UTF-8 so MSD byte order is exercised.
+    return "".join(rng.choices("abé€\U0001F600", k=rng.randint(0, 5)))
+
+def random_rows(rng, size):
+    return [(rng.randint(-50, 50), random_string(rng), i) for i in range(size)]
+
+def expect_value_error(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except ValueError:
+        return
+    raise AssertionError(f"{func.__name__} did not raise ValueError")
+
+# =============================================================================
+# Checks
+# =============================================================================
+
+def check_key_and_reverse(rng):
+    """key=/reverse= match sorted(); stable sorts also keep equal keys in order."""
+    for _ in range(30):
+        rows = random_rows(rng, rng.randint(0, 80))
+        for algo_name, sort in SORTS.items():
+            for key in (itemgetter(0), itemgetter(1)):
+                for reverse in (False, True):
+                    got = rows.copy()
+                    sort(got, key=key, reverse=reverse)
+                    expected = sorted(rows, key=key, reverse=reverse)
+                    if algo_name in pa.STABLE_SORTS:
+                        assert got == expected, (algo_name, reverse)
+                    else:
+                        assert [key(r) for r in got] == [key(r) for r in expected], (algo_name, reverse)
+
+def check_plain_ints(rng):
+    """Bare int lists, including negatives, sort the same with and without key=."""
+    for _ in range(30):
+        values = [rng.randint(-1000, 1000) for _ in range(rng.randint(1, 80))]
+        for algo_name, sort in SORTS.items():
+            plain, keyed = values.copy(), values.copy()
+            sort(plain)
+            sort(keyed, key=lambda x: x)
+            assert plain == keyed == sorted(values), algo_name
+
+def check_radix_strings(rng):
+    """MSD radix agrees with sorted() on str (UTF-8) and bytes, past the insertion cutoff."""
+    for size in (0, 5, pa.MSD_INSERTION_CUTOFF * 20):
+        strings = [random_string(rng) for _ in range(size)]
+        got = strings.copy()
+        pa.radix_sort(got)
+        assert got == sorted(strings)
+
+        encoded = [s.encode("utf-8") for s in strings]
+        got = encoded.copy()
+        pa.radix_sort(got)
+        assert got == sorted(encoded)
+
+def check_radix_rejects_bad_keys(rng):
+    expect_value_error(pa.radix_sort, [3, "a", 1])
+    expect_value_error(pa.radix_sort, [3, "a", 1], key=lambda x: x)
+    expect_value_error(pa.radix_sort, [b"b", "a"])
+    expect_value_error(pa.radix_sort, [1.5, 2.0], key=lambda x: x)
+
+def check_sort_records(rng):
+    """Multi-field and reverse record sorts match sorted() on the equivalent rows."""
+    for _ in range(20):
+        rows = random_rows(rng, rng.randint(0, 80))
+        columns = {name: [row[i] for row in rows] for i, name in enumerate(("num", "text", "id"))}
+
+        for algo_name in pa.STABLE_SORTS:
+            for reverse in (False, True):
+                cols = {name: col.copy() for name, col in columns.items()}
+                pa.sort_records(cols, ["num", "text"], algo_name, reverse=reverse)
+                expected = sorted(rows, key=itemgetter(0, 1), reverse=reverse)
+                assert list(zip(cols["num"], cols["text"], cols["id"])) == expected, (algo_name, reverse)
+
+        # Quick sort is unstable: check key order and that every row stayed intact.
+        cols = {name: col.copy() for name, col in columns.items()}
+        perm = pa.sort_records(cols, "text", "Quick Sort", reverse=True)
+        assert cols["text"] == sorted(columns["text"], reverse=True)
+        assert list(zip(cols["num"], cols["text"], cols["id"])) == [rows[i] for i in perm]
+
+def check_sort_records_rejects_bad_input(rng):
+    expect_value_error(pa.sort_records, {"a": [1, 2], "b": [1]}, "a")
+    expect_value_error(pa.sort_records, {"a": [1], "b": [1]}, ["a", "b"], "Quick Sort")
+
+CHECKS = [
+    check_key_and_reverse,
+    check_plain_ints,
+    check_radix_strings,
+    check_radix_rejects_bad_keys,
+    check_sort_records,
+    check_sort_records_rejects_bad_input,
+]
+
+def main():
+    rng = random.Random(0)
+    failed = 0
+    for check in CHECKS:
+        try:
+            check(rng)
+        except Exception as e:
+            failed += 1
+            print(f"FAIL  {check.__name__}: {type(e).__name__}: {e}")
+        else:
+            print(f"ok    {check.__name__}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 import pygame
 import random
 import time
-from algorithms import bubble_sort, merge_sort, quick_sort, radix_sort, linear_search_wrapper
+from algorithms import bubble_sort, merge_sort, quick_sort, radix_sort, linear_search_wrapper, SortStats
 
 pygame.init()
 
@@ -126,7 +126,103 @@ class DrawInformation:
         self.start_x = self.GRAPH_PAD
 
 # -----------------------------------------------------------------------------
-# 4. HELPER FUNCTIONS
+# 4. RACE PANELS
+# -----------------------------------------------------------------------------
+ALGORITHMS = {
+    "algo_bubble": ("Bubble Sort", bubble_sort),
+    "algo_merge": ("Merge Sort", merge_sort),
+    "algo_quick": ("Quick Sort", quick_sort),
+    "algo_radix": ("Radix Sort", radix_sort),
+    "algo_linear": ("Linear Search", linear_search_wrapper),
+}
+RACE_MIN, RACE_MAX = 2, 5
+
+class RacePanel:
+    """One algorithm in a race: owns a copy of the input and its own sub-surface.
+
+    Bars are only redrawn onto the panel surface when the generator advanced,
+    so finished or idle panels cost a single blit per frame.
+    """
+    HEADER_HEIGHT = 24
+
+    def __init__(self, name, algo_gen, lst, rect, font):
+        self.name = name
+        self.lst = list(lst)
+        self.stats = SortStats()
+        self.generator = algo_gen(self.lst, self.stats)
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size)
+        self.font = font
+        self.min_val = min(self.lst)
+        self.max_val = max(self.lst)
+        self.steps = 0
+        self.done = False
+        self.finish_place = None
+        self.color_map = {}
+        self.dirty = True
+
+    def advance(self, budget):
+        """Runs up to `budget` steps. Returns True if the algorithm finished this frame."""
+        if self.done:
+            return False
+        data = None
+        for _ in range(budget):
+            try:
+                data = next(self.generator)
+            except StopIteration:
+                self.done = True
+                self.color_map = {i: Theme.BAR_SORTED for i in range(len(self.lst))}
+                self.dirty = True
+                return True
+            self.steps += 1
+
+        # Only the last step of the frame is visible, so only its highlights matter.
+        if data is not None:
+            active_indices = data[1]
+            sorted_indices = data[2] if len(data) == 3 else []
+            self.color_map = {idx: Theme.BAR_SORTED for idx in sorted_indices}
+            for idx in active_indices: self.color_map[idx] = Theme.BAR_ACTIVE
+            self.dirty = True
+        return False
+
+    def render(self):
+        surf = self.surface
+        surf.fill(Theme.BG_PANEL)
+
+        header_color = Theme.BAR_SORTED if self.done else Theme.TEXT_WHITE
+        header = f"{self.name:<14} STEPS: {self.steps:<8} COMPARISONS: {self.stats.comparisons}"
+        if self.done: header += f"   #{self.finish_place}"
+        surf.blit(self.font.render(header, True, header_color), (10, 4))
+
+        graph_top = self.HEADER_HEIGHT + 4
+        graph_height = self.rect.height - graph_top - 6
+        block_width = max(1, (self.rect.width - 20) // len(self.lst))
+        value_range = self.max_val - self.min_val + 1
+        for i, val in enumerate(self.lst):
+            height = max(2, (val - self.min_val) / value_range * graph_height)
+            color = self.color_map.get(i, Theme.BAR_DEFAULT)
+            pygame.draw.rect(surf, color, (10 + i * block_width, self.rect.height - 6 - height, max(1, block_width - 1), height))
+        self.dirty = False
+
+    def draw(self, window):
+        if self.dirty:
+            self.render()
+        window.blit(self.surface, self.rect)
+
+def create_race_panels(draw_info, action_keys):
+    """Stacks one panel per selected algorithm inside the graph area, all on copies of the same list."""
+    area = pygame.Rect(20, 80, draw_info.width - draw_info.SIDEBAR_WIDTH - 40, draw_info.height - 100)
+    gap = 8
+    panel_height = (area.height - gap * (len(action_keys) - 1)) // len(action_keys)
+    panels = []
+    for i, key in enumerate(action_keys):
+        name, algo_gen = ALGORITHMS[key]
+        rect = (area.x, area.y + i * (panel_height + gap), area.width, panel_height)
+        panels.append(RacePanel(name, algo_gen, draw_info.lst, rect, draw_info.font_sm))
+    return panels
+
+# -----------------------------------------------------------------------------
+# 5. HELPER FUNCTIONS
 # -----------------------------------------------------------------------------
 def generate_list(n, min_val, max_val, mode="Random"):
     if mode == "Random": return [random.randint(min_val, max_val) for _ in range(n)]
@@ -145,7 +241,7 @@ def draw_sidebar_text(window, text, x, y, font, color=Theme.TEXT_GREY):
     window.blit(surf, (x, y))
 
 # -----------------------------------------------------------------------------
-# 5. MAIN LOOP
+# 6. MAIN LOOP
 # -----------------------------------------------------------------------------
 def main():
     run = True
@@ -153,8 +249,8 @@ def main():
 
     N = 10
     MIN_VAL, MAX_VAL = 5, 100
-    current_algo_name = "Bubble Sort"
-    current_algo_gen = bubble_sort
+    current_algo_key = "algo_bubble"
+    current_algo_name, current_algo_gen = ALGORITHMS[current_algo_key]
     current_input_mode = "Random"
     sorting = False
     
@@ -164,6 +260,11 @@ def main():
     accumulated_time = 0
     ops_count = 0  
 
+    # Race Mode: several algorithms on copies of the same list
+    race_mode = False
+    race_keys = []
+    race_panels = []
+
     lst = generate_list(N, MIN_VAL, MAX_VAL, current_input_mode)
     draw_info = DrawInformation(1100, 700, lst) 
     sidebar_x = draw_info.width - draw_info.SIDEBAR_WIDTH + 20
@@ -175,6 +276,7 @@ def main():
     btn_radix = Button(sidebar_x, 140, 70, 30, "Radix", draw_info.font_sm, "algo_radix")
     btn_linear = Button(sidebar_x + 80, 140, 70, 30, "Linear", draw_info.font_sm, "algo_linear")
     algo_buttons = [btn_bubble, btn_merge, btn_quick, btn_radix, btn_linear]
+    btn_race = Button(sidebar_x + 160, 140, 70, 30, "Race", draw_info.font_sm, "action_race")
     btn_bubble.is_active = True 
 
     btn_random = Button(sidebar_x, 240, 70, 30, "Random", draw_info.font_sm, "input_random")
@@ -193,9 +295,23 @@ def main():
     color_map = {}
 
     while run:
-        clock.tick(slider_speed.value) 
+        # Race mode runs at a fixed frame rate; the speed slider sets the shared step budget instead.
+        clock.tick(60 if race_mode else slider_speed.value) 
+
+        if race_mode and not race_panels:
+            race_panels = create_race_panels(draw_info, race_keys)
         
-        if sorting:
+        if sorting and race_mode:
+            elapsed_time = accumulated_time + (time.time() - start_time)
+            newly_done = [panel for panel in race_panels if panel.advance(slider_speed.value)]
+            # Panels finishing in the same frame are ranked by how few steps they needed.
+            for panel in sorted(newly_done, key=lambda p: p.steps):
+                panel.finish_place = sum(1 for p in race_panels if p.finish_place) + 1
+            ops_count = max(panel.steps for panel in race_panels)
+            if all(panel.done for panel in race_panels):
+                sorting = False
+
+        elif sorting:
             elapsed_time = accumulated_time + (time.time() - start_time)
             try:
                 data = next(algo_generator)
@@ -217,7 +333,10 @@ def main():
         pygame.draw.rect(draw_info.window, Theme.BG_PANEL, (draw_info.width - draw_info.SIDEBAR_WIDTH, 0, draw_info.SIDEBAR_WIDTH, draw_info.height))
         pygame.draw.rect(draw_info.window, Theme.BG_PANEL, (20, 80, draw_info.width - draw_info.SIDEBAR_WIDTH - 40, draw_info.height - 100), border_radius=12)
 
-        for i, val in enumerate(draw_info.lst):
+        for panel in race_panels:
+            panel.draw(draw_info.window)
+
+        for i, val in enumerate(draw_info.lst if not race_mode else []):
             x = draw_info.start_x + i * draw_info.block_width
             norm_height = (val - draw_info.min_val) / (draw_info.max_val - draw_info.min_val + 1)
             height = max(5, norm_height * (draw_info.height - 160))
@@ -228,11 +347,15 @@ def main():
 
         # Labels & Performance Stats
         draw_sidebar_text(draw_info.window, ">_ SortLab", 30, 30, draw_info.font_lg, Theme.ACCENT_CYAN)
-        draw_sidebar_text(draw_info.window, f"{current_algo_name}", 50, 100, draw_info.font_xl, Theme.TEXT_WHITE)
+        if race_mode:
+            draw_sidebar_text(draw_info.window, f"Race: {len(race_keys)} Algorithms", 250, 26, draw_info.font_md, Theme.TEXT_WHITE)
+            draw_sidebar_text(draw_info.window, f"Shared budget: {slider_speed.value} steps/frame", 250, 52, draw_info.font_sm, Theme.TEXT_GREY)
+        else:
+            draw_sidebar_text(draw_info.window, f"{current_algo_name}", 50, 100, draw_info.font_xl, Theme.TEXT_WHITE)
         
-        complexities = {"Bubble": "O(n²)", "Merge": "O(n log n)", "Quick": "O(n log n)", "Radix": "O(nk)", "Linear": "O(n)"}
-        comp_text = complexities.get(current_algo_name.split()[0], "O(n)")
-        draw_sidebar_text(draw_info.window, f"Avg Complexity: {comp_text}", 50, 140, draw_info.font_md, Theme.TEXT_GREY)
+            complexities = {"Bubble": "O(n²)", "Merge": "O(n log n)", "Quick": "O(n log n)", "Radix": "O(nk)", "Linear": "O(n)"}
+            comp_text = complexities.get(current_algo_name.split()[0], "O(n)")
+            draw_sidebar_text(draw_info.window, f"Avg Complexity: {comp_text}", 50, 140, draw_info.font_md, Theme.TEXT_GREY)
 
         draw_sidebar_text(draw_info.window, f"TIME: {elapsed_time:.2f}s", sidebar_x, 480, draw_info.font_md, Theme.ACCENT_CYAN)
         draw_sidebar_text(draw_info.window, f"STEPS: {ops_count}", sidebar_x, 510, draw_info.font_md, Theme.TEXT_WHITE)
@@ -240,13 +363,16 @@ def main():
         draw_sidebar_text(draw_info.window, "ALGORITHM", sidebar_x, 70, draw_info.font_sm)
         draw_sidebar_text(draw_info.window, "INPUT CONDITION", sidebar_x, 210, draw_info.font_sm)
         draw_sidebar_text(draw_info.window, f"ARRAY SIZE: {slider_size.value}", sidebar_x, 340, draw_info.font_sm)
-        draw_sidebar_text(draw_info.window, f"SPEED (FPS): {slider_speed.value}", sidebar_x, 410, draw_info.font_sm)
+        speed_label = "STEPS / FRAME" if race_mode else "SPEED (FPS)"
+        draw_sidebar_text(draw_info.window, f"{speed_label}: {slider_speed.value}", sidebar_x, 410, draw_info.font_sm)
 
-        for btn in algo_buttons + input_buttons:
+        btn_race.is_active = race_mode
+        for btn in algo_buttons + input_buttons + [btn_race]:
             btn.check_hover(pygame.mouse.get_pos())
             btn.draw(draw_info.window)
             
-        btn_start.text = "Pause" if sorting else ("Resume" if algo_generator else "Start")
+        in_progress = any(panel.steps for panel in race_panels) if race_mode else algo_generator
+        btn_start.text = "Pause" if sorting else ("Resume" if in_progress else "Start")
         btn_start.is_active = sorting
         btn_start.draw(draw_info.window, is_filled=True)
         btn_reset.draw(draw_info.window)
@@ -261,7 +387,7 @@ def main():
             if slider_size.handle_event(event):
                 N = slider_size.value
                 draw_info.set_list(generate_list(N, MIN_VAL, MAX_VAL, current_input_mode))
-                sorting = False; algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}
+                sorting = False; algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}; race_panels = []
             
             slider_speed.handle_event(event)
 
@@ -273,23 +399,40 @@ def main():
                     else:
                         sorting = True
                         start_time = time.time()
-                        if not algo_generator: algo_generator = current_algo_gen(draw_info.lst)
+                        if not race_mode and not algo_generator: algo_generator = current_algo_gen(draw_info.lst)
 
                 elif btn_reset.check_click(event.pos):
                     # RESET ALL STATES
                     sorting = False; algo_generator = None; start_time = None; 
                     elapsed_time = 0; accumulated_time = 0; ops_count = 0
                     color_map = {} # Reverts bars to Teal
+                    race_panels = []
                     draw_info.set_list(generate_list(N, MIN_VAL, MAX_VAL, current_input_mode))
 
                 elif not sorting:
+                    if btn_race.check_click(event.pos):
+                        race_mode = not race_mode
+                        if race_mode:
+                            # Race the current algorithm against the next one by default.
+                            keys = list(ALGORITHMS)
+                            race_keys = [current_algo_key, keys[(keys.index(current_algo_key) + 1) % len(keys)]]
+                        for b in algo_buttons: b.is_active = b.action_key in race_keys if race_mode else b.action_key == current_algo_key
+                        algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}; race_panels = []
+
                     for btn in algo_buttons:
-                        if btn.check_click(event.pos):
+                        if btn.check_click(event.pos) and race_mode:
+                            # Toggle membership, keeping between RACE_MIN and RACE_MAX racers.
+                            if btn.action_key in race_keys and len(race_keys) > RACE_MIN:
+                                race_keys.remove(btn.action_key)
+                            elif btn.action_key not in race_keys and len(race_keys) < RACE_MAX:
+                                race_keys.append(btn.action_key)
+                            btn.is_active = btn.action_key in race_keys
+                            elapsed_time = 0; accumulated_time = 0; ops_count = 0; race_panels = []
+                        elif btn.check_click(event.pos):
                             for b in algo_buttons: b.is_active = False
                             btn.is_active = True
-                            current_algo_name = btn.text + (" Search" if "Linear" in btn.text else " Sort")
-                            map_key = {"algo_bubble": bubble_sort, "algo_merge": merge_sort, "algo_quick": quick_sort, "algo_radix": radix_sort, "algo_linear": linear_search_wrapper}
-                            current_algo_gen = map_key[btn.action_key]
+                            current_algo_key = btn.action_key
+                            current_algo_name, current_algo_gen = ALGORITHMS[current_algo_key]
                             algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}
                             draw_info.set_list(generate_list(N, MIN_VAL, MAX_VAL, current_input_mode))
                     
@@ -299,7 +442,7 @@ def main():
                             btn.is_active = True
                             current_input_mode = btn.text
                             draw_info.set_list(generate_list(N, MIN_VAL, MAX_VAL, current_input_mode))
-                            algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}
+                            algo_generator = None; elapsed_time = 0; accumulated_time = 0; ops_count = 0; color_map = {}; race_panels = []
 
     pygame.quit()
 